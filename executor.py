@@ -18,12 +18,14 @@ class Executor:
     """Executes validated PowerShell commands safely."""
 
     @staticmethod
-    def run(command: str) -> tuple[bool, str]:
+    def run(command: str, shell: str = "powershell") -> tuple[bool, str]:
         """
         Execute a single PowerShell command.
 
         Args:
             command: The PowerShell command string (already validated by Parser).
+            shell: PowerShell executable — "powershell" (Windows PowerShell 5.1)
+                   or "pwsh" (PowerShell 7+).
 
         Returns:
             (success: bool, output_or_error: str)
@@ -36,7 +38,7 @@ class Executor:
 
         try:
             result = subprocess.run(
-                ["powershell", "-NoProfile", "-Command", command],
+                [shell, "-NoProfile", "-Command", command],
                 capture_output=True,
                 text=True,
                 timeout=30,          # prevent runaway commands